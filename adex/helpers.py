@@ -1,32 +1,69 @@
 from dataclasses import dataclass
-from functools import reduce
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Set, Tuple, Optional
+from typing import Any, Dict, FrozenSet, List, Set, Tuple, Type, Optional
 
 from adex.type_aliases import Gene, ConditionName, Color
 from adex.models import Condition, METADATA_COLUMNS, DataLoader, ConditionDataLoader, ConditionTissueDataLoader, \
-    FileDataLoader, ConditionSequencingTissueDataLoader, DATASET_INFO_COLUMNS, ConditionSequencingDataLoader
-from polars import DataFrame
+    FileDataLoader, ConditionSequencingTissueDataLoader, DATASET_INFO_COLUMNS, ConditionSequencingDataLoader, \
+    METADATA_COLUMNS_SET, DATASET_INFO_COLUMNS_SET, FIXED_COLUMNS_SET
+from polars import DataFrame, LazyFrame
+from polars.type_aliases import PolarsDataType
 import polars as pl
 import pandas as pd
 import numpy as np
 from pandas.core.series import Series
+from pyarrow import dataset as ds, fs
 from matplotlib import pyplot as plt
+from matplotlib.lines import Line2D
 
 from sklearn.model_selection import cross_val_score, GridSearchCV
 from sklearn.metrics import confusion_matrix, ConfusionMatrixDisplay, accuracy_score, precision_score, recall_score, f1_score, RocCurveDisplay, precision_recall_curve, PrecisionRecallDisplay
 from sklearn.model_selection import LearningCurveDisplay, learning_curve
 
 
-def load_data_per_condition(condition: Condition, path: str) -> List[DataFrame]:
+METADATA_SCHEMA: Dict[str, PolarsDataType] = {"Sample": pl.String} | {column: pl.String for column in METADATA_COLUMNS}
+
+DATASET_INFO_SCHEMA: Dict[str, PolarsDataType] = {column: pl.String for column in DATASET_INFO_COLUMNS} | {
+    "Samples": pl.Int64
+}
+
+CLOUD_FILESYSTEMS: Dict[str, Type[fs.FileSystem]] = {
+    "s3": fs.S3FileSystem,
+    "gs": fs.GcsFileSystem,
+    "gcs": fs.GcsFileSystem
+}
+
+CLOUD_STORAGE_PREFIXES: Tuple[str, ...] = tuple(f"{scheme}://" for scheme in CLOUD_FILESYSTEMS)
+
+
+def load_data_per_condition(
+    condition: Condition,
+    path: str,
+    storage_options: Optional[Dict[str, Any]] = None
+) -> List[LazyFrame]:
     """
-    Loads all the datasets of a certain condition in a list of dataframes
+    Lazily scans all the datasets of a certain condition in a list of lazy dataframes.
+    Nothing is read until the caller collects, so later filters and selections are pushed down to the parquet reader.
+    The files are combined with parallel concatenations, so they are also read concurrently when collected.
+
+    :param condition: the condition whose datasets will be scanned
+    :param path: the path where the samples are located, either local or in cloud storage (s3://, gs:// or gcs://),
+        other URLs such as http(s):// are not supported
+    :param storage_options: keyword arguments of pyarrow's S3FileSystem/GcsFileSystem (credentials, region etc.),
+        used both for listing and for reading the files, unused for local paths. Only the samples are read through
+        them, the metadata files given to get_pre_processed_dataset must always be local
+    :return: one lazy dataframe per dataset file
     """
+    condition_path = f"{path}/{condition.name}"
+    filesystem: Optional[fs.FileSystem] = _storage_filesystem(path, storage_options)
 
-    results = [
-        pl.read_parquet(file)
-        for file in Path(f"{path}/{condition.name}").glob('*.parquet')
-    ]
+    if filesystem is None:
+        files = [str(file) for file in Path(condition_path).glob('*.parquet')]
+    else:
+        files = _list_cloud_parquet_files(condition_path, filesystem)
+
+    results = [_scan_parquet(file, filesystem) for file in files]
 
     if len(results) == 0:
         raise ValueError(f"Possibly wrong path '{path}' provided for files")
@@ -34,40 +71,99 @@ def load_data_per_condition(condition: Condition, path: str) -> List[DataFrame]:
     return results
 
 
-def gene_intersection(dataframes: List[DataFrame]) -> Set[Gene]:
+def _storage_filesystem(path: str, storage_options: Optional[Dict[str, Any]]) -> Optional[fs.FileSystem]:
     """
-    Returns all the common genes found in a list of dataframes
+    Returns the pyarrow filesystem of a cloud storage path, built once so that all its files share it,
+    or None for a local path
     """
-    common_genes = set()
+    if path.startswith(CLOUD_STORAGE_PREFIXES):
+        scheme, _ = path.split("://", 1)
+        return CLOUD_FILESYSTEMS[scheme](**(storage_options or {}))
+
+    if "://" in path:
+        raise ValueError(
+            f"Unsupported storage in path '{path}', only local paths and "
+            f"{', '.join(CLOUD_STORAGE_PREFIXES)} are supported"
+        )
 
-    for df in dataframes:
-        if len(common_genes) == 0:  # First iteration
-            common_genes.update(
-                df.select("gene").to_series().to_list()
-            )
-        else:
-            common_genes.intersection_update(
-                set(df.select("gene").to_series().to_list())
-            )
+    return None
 
-    return common_genes
 
+def _list_cloud_parquet_files(directory: str, filesystem: fs.FileSystem) -> List[str]:
+    scheme, directory_path = directory.split("://", 1)
 
-def common_genes_dataframe(dataframes: List[DataFrame]) -> DataFrame:
+    return [
+        f"{scheme}://{file_info.path}"
+        for file_info in filesystem.get_file_info(fs.FileSelector(directory_path))
+        if file_info.path.endswith(".parquet")
+    ]
+
+
+def _scan_parquet(source: str, filesystem: Optional[fs.FileSystem] = None) -> LazyFrame:
+    """
+    Cloud storage sources are read through the same pyarrow filesystem that lists them, with pre-buffering so that
+    the column chunk requests are coalesced into concurrent ranged reads
+    """
+    if filesystem is not None:
+        _, path = source.split("://", 1)
+        parquet_format = ds.ParquetFileFormat(
+            default_fragment_scan_options=ds.ParquetFragmentScanOptions(pre_buffer=True)
+        )
+        return pl.scan_pyarrow_dataset(ds.dataset(path, filesystem=filesystem, format=parquet_format))
+
+    return pl.scan_parquet(source, parallel="row_groups", low_memory=True, rechunk=False)
+
+
+def gene_intersection(dataframes: List[LazyFrame]) -> Set[Gene]:
+    """
+    Returns all the common genes found in a list of dataframes
+    """
+    if len(dataframes) == 0:
+        return set()
+
+    common_genes: DataFrame = (
+        pl.concat([df.select("gene").unique() for df in dataframes], parallel=True)
+        .group_by("gene")
+        .len()
+        .filter(pl.col("len") == len(dataframes))  # the gene was found in every dataframe
+        .collect()
+    )
+
+    return set(common_genes.get_column("gene").to_list())
+
+
+def common_genes_dataframe(dataframes: List[LazyFrame]) -> DataFrame:
     """
     Gives a dataframe with the samples of all the dataframes joined but only for the common genes
     """
-    head, *tail = dataframes
+    return (
+        pl.concat(
+            [df.with_columns(pl.lit(index).alias("File")) for index, df in enumerate(dataframes)],
+            how="diagonal_relaxed",
+            parallel=True
+        )
+        .group_by("gene", maintain_order=True)
+        .agg(pl.exclude("gene", "File").drop_nulls().first(), pl.col("File").n_unique())
+        .filter(pl.col("File") == len(dataframes))  # the gene was found in every dataframe
+        .drop("File")
+        .collect()
+    )
 
-    return reduce(
-        lambda left, right: left.join(right, on="gene", how="inner"),
-        tail,
-        head
+
+def _outer_join_on_gene(dataframes: List[LazyFrame]) -> LazyFrame:
+    """
+    Same result as outer joining all the dataframes on "gene" one after the other,
+    but built with a single concatenation and group by instead of a chain of joins
+    """
+    return (
+        pl.concat(dataframes, how="diagonal_relaxed", parallel=True)
+        .group_by("gene", maintain_order=True)
+        .agg(pl.exclude("gene").drop_nulls().first())
     )
 
 
 def high_frequency_genes_dataframe(
-    dataframes: List[DataFrame],
+    dataframes: List[LazyFrame],
     allowed_null_percentage: float = 0.2,
     drop_frequencies_column: bool = True
 ) -> DataFrame:
@@ -80,17 +176,16 @@ def high_frequency_genes_dataframe(
     :param drop_frequencies_column: if frequencies column should be dropped (or kept for exploratory analysis)
     :return:
     """
-    head, *tail = dataframes
-
-    outer_joined_df = reduce(
-        lambda left, right: left.join(right, on="gene", how="outer_coalesce"),
-        tail,
-        head
-    )
+    outer_joined_df: LazyFrame = _outer_join_on_gene(dataframes)
+    samples_count = len(outer_joined_df.columns) - 1  # all columns except "gene"
 
     filtered_df = (
-        outer_joined_df.with_columns(pl.sum_horizontal(pl.all().is_null() / pl.all().count()).alias("Null-Percentage"))
+        outer_joined_df
+        .with_columns(
+            (pl.sum_horizontal(pl.exclude("gene").is_null().cast(pl.UInt32)) / samples_count).alias("Null-Percentage")
+        )
         .filter(pl.col("Null-Percentage") <= allowed_null_percentage)
+        .collect()
     )
 
     if drop_frequencies_column:
@@ -99,6 +194,38 @@ def high_frequency_genes_dataframe(
     return filtered_df
 
 
+def _load_samples_metadata(metadata_path: str, datasets_info_path: str) -> DataFrame:
+    return _read_samples_metadata(
+        metadata_path,
+        Path(metadata_path).stat().st_mtime_ns,
+        datasets_info_path,
+        Path(datasets_info_path).stat().st_mtime_ns
+    )
+
+
+@lru_cache(maxsize=4)
+def _read_samples_metadata(
+    metadata_path: str,
+    metadata_modification_time: int,
+    datasets_info_path: str,
+    datasets_info_modification_time: int
+) -> DataFrame:
+    """
+    The metadata of every sample joined with the extra information of its dataset.
+    Cached per paths and modification times, so the files are parsed again only when they change
+    """
+    return (
+        pl.read_csv(metadata_path, schema=METADATA_SCHEMA)
+        .unique(subset=["Sample"])  # Filters duplicate rows for a sample in metadata
+        .join(
+            pl.read_csv(datasets_info_path, schema=DATASET_INFO_SCHEMA),
+            left_on="GSE",
+            right_on="Dataset",
+            how="inner"
+        )
+    )
+
+
 def get_pre_processed_dataset(
     data_loader: DataLoader,
     data_path: str,
@@ -106,22 +233,66 @@ def get_pre_processed_dataset(
     datasets_info_path: str,
     allowed_null_percentage: float = 0.2,
     return_metadata: bool = True,
+    storage_options: Optional[Dict[str, Any]] = None
 ) -> Optional[DataFrame]:
     """
     :param data_loader: determines the subset of the data that will be loaded
-    :param data_path: the path where the samples are located
+    :param data_path: the path where the samples are located, either local or in cloud storage (s3://, gs:// or gcs://)
     :param metadata_path: the path where the metadata of the samples is located
     :param datasets_info_path: the path where the datasets extra information is located
     :param allowed_null_percentage: will keep only genes that have a lower than this null percentage across samples
     :param return_metadata: if the metadata columns will be returned as part of the dataframe
+    :param storage_options: keyword arguments of pyarrow's S3FileSystem/GcsFileSystem for reading the samples from
+        cloud storage, they only apply to data_path, metadata_path and datasets_info_path must always be local
     :return: a dataset of a particular condition/sequencing-method/tissue/file pre-processed in its final state
     """
 
+    # Extra data filtering, applied on the (small) metadata before any sample is read
+    samples_metadata: DataFrame = _load_samples_metadata(metadata_path, datasets_info_path)
+
+    match data_loader:
+        case ConditionTissueDataLoader(_, tissue):
+            samples_metadata = samples_metadata.filter(pl.col("Tissue") == tissue.value)
+        case ConditionSequencingDataLoader(_, sequencing_technique):
+            samples_metadata = samples_metadata.filter(pl.col("Method") == sequencing_technique.value)
+        case ConditionSequencingTissueDataLoader(_, sequencing_technique, tissue, _):
+            samples_metadata = samples_metadata.filter(
+                (pl.col("Tissue") == tissue.value) & (pl.col("Method") == sequencing_technique.value)
+            )
+        case _:
+            pass  # nothing to do
+
+    # keep a sample only if metadata exists for the sample
+    selected_samples: FrozenSet[str] = frozenset(samples_metadata.get_column("Sample").to_list())
+
     match data_loader:
         case FileDataLoader(condition, file_name, _, _):
-            data: List[DataFrame] = [pl.read_parquet(f"{data_path}/{condition.name}/{file_name}")]
+            data: List[LazyFrame] = [
+                _scan_parquet(
+                    f"{data_path}/{condition.name}/{file_name}", _storage_filesystem(data_path, storage_options)
+                )
+            ]
         case _:
-            data: List[DataFrame] = load_data_per_condition(data_loader.condition, data_path)
+            data: List[LazyFrame] = load_data_per_condition(data_loader.condition, data_path, storage_options)
+
+    # Genes are rows and samples are columns in the parquet files, so selecting them early is pushed down to the reader
+    match data_loader:
+        case FileDataLoader(_, _, genes, samples):
+            if genes is not None:
+                data = [df.filter(pl.col("gene").is_in(genes)) for df in data]
+            if samples is not None:
+                selected_samples = selected_samples.intersection(samples)
+        case ConditionSequencingTissueDataLoader(_, _, _, genes) if genes is not None:
+            data = [df.filter(pl.col("gene").is_in(genes)) for df in data]
+
+    if len(selected_samples) == 0:  # No rows
+        return None
+
+    data = [_keep_only_selected_samples(df, selected_samples) for df in data]
+
+    # The metadata covers all conditions, so the selected samples may not be in any of the scanned files
+    if all(df.columns == ["gene"] for df in data):  # No rows
+        return None
 
     # keep only frequent genes between datasets
     # NOTE: Commenting! This is better to happen later after we apply more filtering, otherwise we end-up
@@ -129,91 +300,69 @@ def get_pre_processed_dataset(
     # data_frequent_genes: DataFrame = high_frequency_genes_dataframe(data, allowed_null_percentage)
 
     # Join all dataframes (used to happen in `high_frequency_genes_dataframe` before)
-    head, *tail = data
-    joined_df: DataFrame = reduce(
-        lambda left, right: left.join(right, on="gene", how="outer_coalesce"),
-        tail,
-        head
-    )
+    joined_df: DataFrame = _outer_join_on_gene(data).collect(streaming=True)
+
+    # Transpose through numpy, since every gene row becomes one contiguous column of the transposed dataframe
+    gene_names: List[Gene] = joined_df.get_column("gene").to_list()
+    sample_values: DataFrame = joined_df.select(pl.exclude("gene").cast(pl.Float32))
+    sample_names: List[str] = sample_values.columns
+    values: np.ndarray = sample_values.to_numpy()  # genes x samples
+    nulls: np.ndarray = sample_values.select(pl.all().is_null()).to_numpy()  # numpy has no nulls, only NaN
+
+    # Restore the nulls only where they were, NaN values of the files are kept as they are
+    gene_columns: List[pl.Series] = [
+        pl.Series(gene, gene_values).scatter(np.flatnonzero(gene_nulls), None)
+        if gene_nulls.any() else pl.Series(gene, gene_values)
+        for gene, gene_values, gene_nulls in zip(gene_names, values, nulls)
+    ]
 
-    # Transpose
-    transposed = joined_df.transpose(include_header=True, header_name='Sample')
-    transposed_fixed = (
-            transposed
-            .rename(transposed.head(1).to_dicts().pop())    # add header
-            .slice(1,)                                      # remove first row because it is the header duplicated
-            .rename({"gene": "Sample"})                     # fix header
+    transposed_fixed: LazyFrame = (
+        pl.DataFrame(pl.Series("Sample", sample_names))
+        .hstack(gene_columns)
+        .lazy()
     )
 
-    # Change type of numerical columns
-    sample_col = transposed_fixed.select("Sample")
-    transposed_fixed = transposed_fixed.select(pl.exclude("Sample")).cast(pl.Float64)
-    transposed_fixed = sample_col.with_columns(transposed_fixed)
-
-    # join with various metadata files and keep a sample only if metadata exists for the sample
-    datasets_info = pl.read_csv(datasets_info_path)
-
-    transposed_fixed_w_metadata = transposed_fixed.join(
-        pl.read_csv(metadata_path).unique(subset=["Sample"]),  # Filters duplicate rows for a sample in metadata
+    # join with the metadata, the wide dataframe is probed only once
+    transposed_fixed_w_metadata: LazyFrame = transposed_fixed.join(
+        samples_metadata.lazy(),
         on="Sample",
         how="inner"
-    ).join(
-        datasets_info,
-        left_on="GSE",
-        right_on="Dataset",
-        how="inner"
     )
 
-    # Extra data filtering
     match data_loader:
-        case ConditionTissueDataLoader(_, tissue):
-            transposed_fixed_w_metadata = transposed_fixed_w_metadata.filter(pl.col("Tissue") == tissue.value)
-        case ConditionSequencingDataLoader(_, sequencing_technique):
-            transposed_fixed_w_metadata = (
-                transposed_fixed_w_metadata
-                .filter(pl.col("Method") == sequencing_technique.value)
-            )
-        case FileDataLoader(_, _, genes, samples):
-            if genes is not None:
-                transposed_fixed_w_metadata = _keep_only_selected_genes(transposed_fixed_w_metadata, genes)
-            if samples is not None:
-                transposed_fixed_w_metadata = _keep_only_selected_samples(transposed_fixed_w_metadata, samples)
-        case ConditionSequencingTissueDataLoader(_, sequencing_technique, tissue, genes):
-            transposed_fixed_w_metadata = (
-                transposed_fixed_w_metadata
-                .filter((pl.col("Tissue") == tissue.value) & (pl.col("Method") == sequencing_technique.value))
-            )
+        case FileDataLoader(_, _, genes, _) | ConditionSequencingTissueDataLoader(_, _, _, genes) if genes is not None:
+            transposed_fixed_w_metadata = _keep_only_selected_genes(transposed_fixed_w_metadata, genes)
 
-            if genes is not None:
-                transposed_fixed_w_metadata = _keep_only_selected_genes(transposed_fixed_w_metadata, genes)
-        case _:
-            pass  # nothing to do
+    collected: DataFrame = transposed_fixed_w_metadata.collect(streaming=True)
 
-    if transposed_fixed_w_metadata.shape[0] == 0:  # No rows
+    if collected.shape[0] == 0:  # No rows
         return None
 
     # Drop a column if nulls exceed the 'allowed_null_percentage':
-    transposed_fixed_w_metadata = transposed_fixed_w_metadata[[s.name for s in transposed_fixed_w_metadata if ((s.null_count() / transposed_fixed_w_metadata.height) <= allowed_null_percentage)]]
+    null_counts = collected.null_count().row(0)
+    collected = collected.select([
+        column
+        for column, null_count in zip(collected.columns, null_counts)
+        if (null_count / collected.height) <= allowed_null_percentage
+    ])
 
     if return_metadata:
-        return transposed_fixed_w_metadata
+        return collected
     else:
-        return transposed_fixed_w_metadata.drop(METADATA_COLUMNS).drop(DATASET_INFO_COLUMNS)
+        return collected.drop(list(METADATA_COLUMNS_SET | DATASET_INFO_COLUMNS_SET))
 
 
-def _keep_only_selected_genes(input: DataFrame, genes: List[str]) -> DataFrame:
-    existing_columns: Set[str] = set(input.columns)
+def _keep_only_selected_genes(input: LazyFrame, genes: List[str]) -> LazyFrame:
+    selected_genes: FrozenSet[str] = frozenset(genes)
 
-    fixed_columns: Set[str] = {"Sample"}.union(METADATA_COLUMNS).union(DATASET_INFO_COLUMNS).intersection(existing_columns)
-    fixed_columns_and_genes: Set[str] = fixed_columns.union(set(genes))
-    common_columns_set: Set[str] = fixed_columns_and_genes.intersection(existing_columns)
+    # Single pass that keeps the existing column order
+    return input.select([
+        column for column in input.columns if column in FIXED_COLUMNS_SET or column in selected_genes
+    ])
 
-    common_columns: List[str] = ["Sample"] + list(fixed_columns - {"Sample"}) + list(common_columns_set - fixed_columns)  # Re-ordering
-    return input.select(common_columns)
 
-
-def _keep_only_selected_samples(input: DataFrame, samples: List[str]) -> DataFrame:
-    return input.filter(pl.col("Sample").is_in(samples))
+def _keep_only_selected_samples(input: LazyFrame, samples: FrozenSet[str]) -> LazyFrame:
+    return input.select([column for column in input.columns if column == "gene" or column in samples])
 
 
 @dataclass(frozen=True)
@@ -254,23 +403,45 @@ def plot_condition_2d(
         case _:
             raise ValueError(f"DataLoader '{data_loader}' not handled in plotting")
 
-    for target, color in plotting_color_parameters.target_colors:
-        indices = plotting_color_parameters.column_that_defines_colors == target
-        plt.scatter(
-            df_to_plot.loc[indices, x_label],
-            df_to_plot.loc[indices, y_label],
-            c=color,
-            s=50
-        )
+    # One scatter for all targets, samples of a target without a color are not plotted
+    colors: np.ndarray = plotting_color_parameters.column_that_defines_colors.map(
+        dict(plotting_color_parameters.target_colors)
+    ).to_numpy()
+    plotted: np.ndarray = pd.notna(colors)
+    plt.scatter(
+        df_to_plot[x_label].to_numpy()[plotted],
+        df_to_plot[y_label].to_numpy()[plotted],
+        c=colors[plotted],
+        s=50
+    )
 
     targets = [target for target, _ in plotting_color_parameters.target_colors]
-    plt.legend(targets, prop={'size': 15})
+    legend_markers = [
+        Line2D([], [], marker="o", linestyle="", color=color)
+        for _, color in plotting_color_parameters.target_colors
+    ]
+    plt.legend(legend_markers, targets, prop={'size': 15})
+
+
+def _as_float32_features(features):
+    """
+    Dataframes stay dataframes, so sklearn still checks the feature names and their order at predict time
+    """
+    match features:
+        case pd.DataFrame():
+            return features.astype(np.float32)
+        case pl.DataFrame():
+            return features.cast(pl.Float32)
+        case _:
+            return np.ascontiguousarray(features, dtype=np.float32)
 
 
 def run_ml_model(classifier, x_train, y_train, x_test, y_test, cv=4, param_grid=None):
-    raveled_y_train = np.ravel(y_train)
-    base_model = classifier.fit(x_train, raveled_y_train)
-    print(f"Default Parameters of Base Model: {base_model.get_params()}")
+    # Converted once, so the validation in every fit/predict does not copy them again
+    x_train = _as_float32_features(x_train)
+    x_test = _as_float32_features(x_test)
+    raveled_y_train = np.ascontiguousarray(np.ravel(y_train))
+    print(f"Default Parameters of Base Model: {classifier.get_params()}")
 
     # Possibly hyperparameter tuning with cross validation
     if param_grid is not None:
@@ -280,18 +451,27 @@ def run_ml_model(classifier, x_train, y_train, x_test, y_test, cv=4, param_grid=
             estimator=classifier,
             param_grid=param_grid,
             cv=cv,
-            verbose=1
+            verbose=1,
+            n_jobs=-1,
+            return_train_score=False
         ).fit(x_train, raveled_y_train)
 
         selected_model = grid_search_cv.best_estimator_
         print("Running with hyper-parameter tuned model")
         print(f"Optimised Model Parameters: {selected_model.get_params()}")
+
+        # Cross Validation (already done for the selected parameters during the search)
+        scores = np.array([
+            grid_search_cv.cv_results_[f"split{split}_test_score"][grid_search_cv.best_index_]
+            for split in range(grid_search_cv.n_splits_)
+        ])
     else:
         print("Running with base model")
-        selected_model = base_model
+        selected_model = classifier.fit(x_train, raveled_y_train)
+
+        # Cross Validation
+        scores = cross_val_score(selected_model, x_train, raveled_y_train, cv=cv, n_jobs=-1)
 
-    # Cross Validation
-    scores = cross_val_score(selected_model, x_train, raveled_y_train, cv=cv)
     print(f"Cross Validation Scores (cv={cv}): {','.join([str(score) for score in scores])}")
     print("Cross Validation gives %0.2f accuracy with a standard deviation of %0.2f" % (scores.mean(), scores.std()))
 
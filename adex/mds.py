@@ -1,8 +1,8 @@
 from typing import List, Tuple, Optional
 
 from adex.helpers import get_pre_processed_dataset, plot_condition_2d, PlottingColorParameters
-from adex.models import METADATA_COLUMNS, ConditionDataLoader, DataLoader, ConditionTissueDataLoader, \
-    FileDataLoader, ConditionSequencingTissueDataLoader, DATASET_INFO_COLUMNS
+from adex.models import FIXED_COLUMNS_SET, ConditionDataLoader, DataLoader, ConditionTissueDataLoader, \
+    FileDataLoader, ConditionSequencingTissueDataLoader
 from sklearn.manifold import MDS
 from matplotlib import pyplot as plt
 
@@ -55,9 +55,7 @@ class MdsHelper:
 
             self.dataset_only_features = (
                 self.dataset
-                .drop("Sample")
-                .drop(METADATA_COLUMNS)
-                .drop(DATASET_INFO_COLUMNS)
+                .drop(list(FIXED_COLUMNS_SET))
                 .to_pandas()
                 .fillna(0)  # Possibly a problem!!! Although not many are left in this dataset due to pre-processing
             )
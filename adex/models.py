@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 from enum import Enum
-from typing import List, Tuple, Optional
+from typing import FrozenSet, List, Tuple, Optional
 
 from adex.type_aliases import Color, Tissue
 
@@ -40,6 +40,13 @@ DATASET_INFO_COLUMNS = [
 ]
 
 
+METADATA_COLUMNS_SET: FrozenSet[str] = frozenset(METADATA_COLUMNS)
+
+DATASET_INFO_COLUMNS_SET: FrozenSet[str] = frozenset(DATASET_INFO_COLUMNS)
+
+FIXED_COLUMNS_SET: FrozenSet[str] = frozenset(["Sample"]) | METADATA_COLUMNS_SET | DATASET_INFO_COLUMNS_SET
+
+
 class TissueEnum(Enum):
     PERIPHERAL_BLOOD = "Peripheral blood"
     WHOLE_BLOOD = "Whole blood"
@@ -1,7 +1,7 @@
 from typing import Tuple, List, Optional
 
 from adex.helpers import get_pre_processed_dataset, plot_condition_2d, PlottingColorParameters
-from adex.models import DATASET_INFO_COLUMNS, METADATA_COLUMNS, DataLoader, ConditionDataLoader, \
+from adex.models import FIXED_COLUMNS_SET, DataLoader, ConditionDataLoader, \
     ConditionTissueDataLoader, \
     FileDataLoader, ConditionSequencingTissueDataLoader, ConditionSequencingDataLoader
 
@@ -52,7 +52,7 @@ class PcaHelper:
             logging.info(f"Loaded dataset for PCA with shape: Samples({samples}), Genes+Metadata({genes})")
 
             dataset_only_features: pd.DataFrame = (
-                self.dataset.drop("Sample").drop(METADATA_COLUMNS).drop(DATASET_INFO_COLUMNS).to_pandas()
+                self.dataset.drop(list(FIXED_COLUMNS_SET)).to_pandas()
             )
             dataset_features_array: np.ndarray = dataset_only_features.values
 